@@ -7,14 +7,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.aoc_cli import (
-    check_aoc_cli,
-    download_input,
-    download_puzzle,
-    read_puzzle,
-)
-from src.runner import run_all, run_day, time_all, time_day
-from src.template import load_config, scaffold_day
+from src.template import load_config
 
 
 def main():
@@ -52,10 +45,11 @@ def main():
         "download", help="Download input and puzzle"
     )
     download_parser.add_argument("day", type=int, help="Day number (1-25)")
-    download_parser.add_argument(
+    download_only = download_parser.add_mutually_exclusive_group()
+    download_only.add_argument(
         "--input-only", action="store_true", help="Only download input"
     )
-    download_parser.add_argument(
+    download_only.add_argument(
         "--puzzle-only", action="store_true", help="Only download puzzle"
     )
 
@@ -80,7 +74,7 @@ def main():
         "time", help="Benchmark a day's solution"
     )
     time_parser.add_argument(
-        "day", type=int, nargs="?", help="Day number (1-25)"
+        "days", type=int, nargs="*", help="Day number(s) (1-25)"
     )
     time_parser.add_argument("--all", action="store_true", help="Time all days")
 
@@ -90,6 +84,8 @@ def main():
     current_year = args.year if hasattr(args, "year") else year
 
     if args.command == "scaffold":
+        from src.template import scaffold_day
+
         try:
             solution_path, test_path, example_path = scaffold_day(
                 args.day, download=args.download
@@ -105,6 +101,13 @@ def main():
             sys.exit(1)
 
     elif args.command == "download":
+        from src.aoc_cli import (
+            check_aoc_cli,
+            download_both,
+            download_input,
+            download_puzzle,
+        )
+
         try:
             if not check_aoc_cli():
                 print("✗ Error: aoc-cli not installed", file=sys.stderr)
@@ -115,18 +118,22 @@ def main():
                 )
                 sys.exit(1)
 
-            if not args.puzzle_only:
+            if args.input_only:
                 download_input(args.day, current_year)
                 print(f"✓ Downloaded input for day {args.day:02d}")
-
-            if not args.input_only:
+            elif args.puzzle_only:
                 download_puzzle(args.day, current_year)
                 print(f"✓ Downloaded puzzle for day {args.day:02d}")
+            else:
+                download_both(args.day, current_year)
+                print(f"✓ Downloaded input and puzzle for day {args.day:02d}")
         except Exception as e:
             print(f"✗ Error: {e}", file=sys.stderr)
             sys.exit(1)
 
     elif args.command == "read":
+        from src.aoc_cli import read_puzzle
+
         try:
             puzzle = read_puzzle(args.day, current_year)
             print(puzzle)
@@ -135,16 +142,24 @@ def main():
             sys.exit(1)
 
     elif args.command == "solve":
+        from src.runner import run_day
+
         run_day(args.day, current_year)
 
     elif args.command == "all":
+        from src.runner import run_all
+
         run_all(current_year)
 
     elif args.command == "time":
+        from src.runner import time_all, time_day
+
         if args.all:
             time_all(current_year)
-        elif args.day:
-            time_day(args.day, current_year)
+        elif len(args.days) == 1:
+            time_day(args.days[0], current_year)
+        elif args.days:
+            time_all(current_year, args.days)
         else:
             print("✗ Error: Specify a day or use --all", file=sys.stderr)
             sys.exit(1)
@@ -1,12 +1,19 @@
 """AOC CLI integration for downloading inputs and puzzles."""
 
+import functools
+import mmap
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
+_THIS_DIR = Path(__file__).resolve().parent
+_ROOT = _THIS_DIR.parent
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
-    return Path(__file__).parent.parent
+    return _ROOT
 
 
 def get_aoc_data_dir(year: int | None = None) -> Path:
@@ -25,12 +32,27 @@ def get_aoc_data_dir(year: int | None = None) -> Path:
     return root / str(year) / "data"
 
 
+@functools.lru_cache(maxsize=1)
 def check_aoc_cli() -> bool:
-    """Check if aoc-cli is installed."""
+    """Check if aoc-cli is installed.
+
+    The result is cached, and ``aoc --version`` is only spawned if ``aoc``
+    is found on PATH.
+    """
+    aoc_path = shutil.which("aoc")
+    if aoc_path is None:
+        return False
+
     try:
-        subprocess.run(["aoc", "--version"], capture_output=True, check=True)
+        subprocess.run(
+            [aoc_path, "--version"], capture_output=True, check=True, timeout=2
+        )
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        FileNotFoundError,
+    ):
         return False
 
 
@@ -52,13 +74,12 @@ def download_input(day: int, year: int) -> Path:
         )
 
     data_dir = get_aoc_data_dir(year)
-    data_dir.parent.mkdir(parents=True, exist_ok=True)
     input_file = data_dir / "inputs" / f"{day:02d}.txt"
     input_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Use aoc-cli to download - run from project root
     try:
-        result = subprocess.run(
+        subprocess.run(
             [
                 "aoc",
                 "download",
@@ -74,18 +95,9 @@ def download_input(day: int, year: int) -> Path:
             cwd=get_project_root(),
             capture_output=True,
             text=True,
+            check=True,
         )
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to download input: {result.stderr}")
-
-        # Verify file was created
-        if not input_file.exists():
-            raise RuntimeError(
-                f"Download succeeded but file not found at {input_file}\n"
-                f"stdout: {result.stdout}\nstderr: {result.stderr}"
-            )
-
         return input_file
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to download input: {e.stderr}")
@@ -109,13 +121,12 @@ def download_puzzle(day: int, year: int) -> Path:
         )
 
     data_dir = get_aoc_data_dir(year)
-    data_dir.parent.mkdir(parents=True, exist_ok=True)
     puzzle_file = data_dir / "puzzles" / f"{day:02d}.md"
     puzzle_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Use aoc-cli to download - run from project root
     try:
-        result = subprocess.run(
+        subprocess.run(
             [
                 "aoc",
                 "download",
@@ -131,26 +142,71 @@ def download_puzzle(day: int, year: int) -> Path:
             cwd=get_project_root(),
             capture_output=True,
             text=True,
+            check=True,
         )
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to download puzzle: {result.stderr}")
-
-        # Verify file was created
-        if not puzzle_file.exists():
-            raise RuntimeError(
-                f"Download succeeded but file not found at {puzzle_file}\n"
-                f"stdout: {result.stdout}\nstderr: {result.stderr}"
-            )
-
         return puzzle_file
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to download puzzle: {e.stderr}")
 
 
+def download_both(day: int, year: int) -> tuple[Path, Path]:
+    """
+    Download input and puzzle description in a single aoc-cli invocation.
+
+    Args:
+        day: Day number (1-25)
+        year: Year
+
+    Returns:
+        Tuple of (input_file, puzzle_file)
+    """
+    if not check_aoc_cli():
+        raise RuntimeError(
+            "aoc-cli not found. Install it with: cargo install aoc-cli\n"
+            "Then configure with: aoc credentials -s <session_cookie>"
+        )
+
+    data_dir = get_aoc_data_dir(year)
+    input_file = data_dir / "inputs" / f"{day:02d}.txt"
+    puzzle_file = data_dir / "puzzles" / f"{day:02d}.md"
+    input_file.parent.mkdir(parents=True, exist_ok=True)
+    puzzle_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Use aoc-cli to download - run from project root
+    try:
+        subprocess.run(
+            [
+                "aoc",
+                "download",
+                "--year",
+                str(year),
+                "--day",
+                str(day),
+                "--input-file",
+                str(input_file),
+                "--puzzle-file",
+                str(puzzle_file),
+                "--overwrite",
+            ],
+            cwd=get_project_root(),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        return input_file, puzzle_file
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to download data: {e.stderr}")
+
+
+@functools.lru_cache(maxsize=64)
 def read_input(day: int, year: int | None = None) -> str:
     """Read input file for a specific day.
 
+    Results are cached per process; call ``read_input.cache_clear()`` to
+    force a fresh read (e.g. for cold-cache benchmarks).
+
     Args:
         day: Day number (1-25)
         year: Optional year. If not provided, uses root data directory.
@@ -161,18 +217,56 @@ def read_input(day: int, year: int | None = None) -> str:
     data_dir = get_aoc_data_dir(year)
     input_file = data_dir / "inputs" / f"{day:02d}.txt"
 
-    if not input_file.exists():
+    try:
+        return input_file.read_text()
+    except FileNotFoundError as e:
         raise FileNotFoundError(
             f"Input file not found: {input_file}\n"
             f"Download it with: python main.py download {day}"
-        )
+        ) from e
+
 
-    return input_file.read_text()
+def read_input_mmap(day: int, year: int | None = None) -> mmap.mmap:
+    """Memory-map the input file for a specific day.
 
+    Useful for large inputs that a solution wants to scan as bytes without
+    copying the whole file into a str first.
 
+    Args:
+        day: Day number (1-25)
+        year: Optional year. If not provided, uses root data directory.
+
+    Returns:
+        Read-only mapping of the input file. Close it when done.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+        ValueError: If the input file is empty (empty files cannot be mapped).
+    """
+    data_dir = get_aoc_data_dir(year)
+    input_file = data_dir / "inputs" / f"{day:02d}.txt"
+
+    try:
+        fd = os.open(input_file, os.O_RDONLY)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"Input file not found: {input_file}\n"
+            f"Download it with: python main.py download {day}"
+        ) from e
+
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=64)
 def read_example(day: int, year: int | None = None) -> str:
     """Read example file for a specific day.
 
+    Results are cached per process; call ``read_example.cache_clear()`` to
+    force a fresh read.
+
     Args:
         day: Day number (1-25)
         year: Optional year. If not provided, uses root data directory.
@@ -183,10 +277,12 @@ def read_example(day: int, year: int | None = None) -> str:
     data_dir = get_aoc_data_dir(year)
     example_file = data_dir / "examples" / f"{day:02d}.txt"
 
-    if not example_file.exists():
-        raise FileNotFoundError(f"Example file not found: {example_file}")
-
-    return example_file.read_text()
+    try:
+        return example_file.read_text()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"Example file not found: {example_file}"
+        ) from e
 
 
 def read_puzzle(day: int, year: int | None = None) -> str:
@@ -202,10 +298,10 @@ def read_puzzle(day: int, year: int | None = None) -> str:
     data_dir = get_aoc_data_dir(year)
     puzzle_file = data_dir / "puzzles" / f"{day:02d}.md"
 
-    if not puzzle_file.exists():
+    try:
+        return puzzle_file.read_text()
+    except FileNotFoundError as e:
         raise FileNotFoundError(
             f"Puzzle file not found: {puzzle_file}\n"
             f"Download it with: python main.py download {day}"
-        )
-
-    return puzzle_file.read_text()
+        ) from e
@@ -4,9 +4,53 @@ import importlib.util
 import sys
 import time
 from pathlib import Path
+from types import ModuleType
 
 from src.aoc_cli import read_input
-from src.template import get_available_days
+from src.template import get_available_days, iter_day_modules
+
+_THIS_DIR = Path(__file__).resolve().parent
+_ROOT = _THIS_DIR.parent
+
+# Loaded solution modules, keyed by (year, day)
+_module_cache: dict[tuple[int | None, int], ModuleType] = {}
+
+
+def _day_module_path(day: int, year: int | None = None) -> Path:
+    """Get the path to a day's solution module."""
+    day_padded = f"{day:02d}"
+    if year is None:
+        return _THIS_DIR / "solutions" / f"day{day_padded}.py"
+    return _ROOT / str(year) / "solutions" / f"day{day_padded}.py"
+
+
+def _load_day_module(
+    day: int, year: int | None = None, module_path: Path | None = None
+) -> ModuleType:
+    """Load a day's solution module, reusing it if already loaded.
+
+    Args:
+        day: Day number (1-25)
+        year: Optional year. If not provided, uses root src/solutions.
+        module_path: Optional path to the module, if already known.
+
+    Returns:
+        The loaded solution module.
+    """
+    key = (year, day)
+    if key in _module_cache:
+        return _module_cache[key]
+
+    if module_path is None:
+        module_path = _day_module_path(day, year)
+    spec = importlib.util.spec_from_file_location(f"day{day:02d}", module_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load {module_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _module_cache[key] = module
+    return module
 
 
 def run_day(day: int, year: int | None = None) -> None:
@@ -17,14 +61,7 @@ def run_day(day: int, year: int | None = None) -> None:
         year: Optional year. If not provided, uses root src/solutions.
     """
     day_padded = f"{day:02d}"
-    root = Path(__file__).parent.parent
-
-    if year is None:
-        module_path = (
-            Path(__file__).parent / "solutions" / f"day{day_padded}.py"
-        )
-    else:
-        module_path = root / str(year) / "solutions" / f"day{day_padded}.py"
+    module_path = _day_module_path(day, year)
 
     if not module_path.exists():
         print(f"✗ Error: Solution for day {day} not found", file=sys.stderr)
@@ -32,14 +69,7 @@ def run_day(day: int, year: int | None = None) -> None:
 
     try:
         # Load the module dynamically
-        spec = importlib.util.spec_from_file_location(
-            f"day{day_padded}", module_path
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load {module_path}")
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = _load_day_module(day, year)
 
         # Read input and run solutions
         try:
@@ -78,37 +108,21 @@ def run_all(year: int | None = None) -> None:
     Args:
         year: Optional year. If not provided, uses root src/solutions.
     """
-    available_days = get_available_days(year)
+    day_modules = iter_day_modules(year)
 
-    if not available_days:
+    if not day_modules:
         print("No solutions found")
         return
 
-    root = Path(__file__).parent.parent
     total_time = 0
-    print(f"Running {len(available_days)} days...")
+    print(f"Running {len(day_modules)} days...")
     print("=" * 40)
 
-    for day in available_days:
+    for day, module_path in day_modules:
         day_padded = f"{day:02d}"
 
-        if year is None:
-            module_path = (
-                Path(__file__).parent / "solutions" / f"day{day_padded}.py"
-            )
-        else:
-            module_path = root / str(year) / "solutions" / f"day{day_padded}.py"
-
         try:
-            spec = importlib.util.spec_from_file_location(
-                f"day{day_padded}", module_path
-            )
-            if spec is None or spec.loader is None:
-                print(f"✗ Day {day_padded}: Could not load module")
-                continue
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = _load_day_module(day, year, module_path)
 
             try:
                 input_text = read_input(day, year)
@@ -141,6 +155,36 @@ def run_all(year: int | None = None) -> None:
     print(f"Total time: {total_time * 1000:.2f}ms")
 
 
+def _run_benchmarks(test_paths: list[Path]) -> int:
+    """Run the benchmark-marked tests in-process with a single pytest session.
+
+    Args:
+        test_paths: Test files or directories to collect.
+
+    Returns:
+        The pytest exit code.
+    """
+    try:
+        import pytest
+    except ImportError:
+        print(
+            "✗ Error: pytest not installed. Install dev dependencies "
+            "with: uv sync",
+            file=sys.stderr,
+        )
+        return 1
+
+    return pytest.main(
+        [
+            *(str(path) for path in test_paths),
+            "-v",
+            "-m",
+            "benchmark",
+            "--benchmark-only",
+        ]
+    )
+
+
 def time_day(day: int, year: int | None = None) -> None:
     """Benchmark a specific day's solution using pytest.
 
@@ -149,41 +193,26 @@ def time_day(day: int, year: int | None = None) -> None:
         year: Optional year. If not provided, uses root tests.
     """
     day_padded = f"{day:02d}"
-    root = Path(__file__).parent.parent
 
     if year is None:
-        test_path = root / "tests" / f"test_day{day_padded}.py"
+        test_path = _ROOT / "tests" / f"test_day{day_padded}.py"
     else:
-        test_path = root / str(year) / "tests" / f"test_day{day_padded}.py"
+        test_path = _ROOT / str(year) / "tests" / f"test_day{day_padded}.py"
 
     if not test_path.exists():
         print(f"✗ Error: Test file for day {day} not found", file=sys.stderr)
         sys.exit(1)
 
-    import subprocess
-
-    result = subprocess.run(
-        [
-            "uv",
-            "run",
-            "pytest",
-            str(test_path),
-            "-v",
-            "-m",
-            "benchmark",
-            "--benchmark-only",
-        ],
-        cwd=root,
-    )
-
-    sys.exit(result.returncode)
+    sys.exit(_run_benchmarks([test_path]))
 
 
-def time_all(year: int | None = None) -> None:
+def time_all(year: int | None = None, days: list[int] | None = None) -> None:
     """Benchmark all available solutions using pytest.
 
     Args:
         year: Optional year. If not provided, uses root tests.
+        days: Optional list of days to benchmark in one pytest session. If
+              not provided, benchmarks every test in the tests directory.
     """
     available_days = get_available_days(year)
 
@@ -191,27 +220,36 @@ def time_all(year: int | None = None) -> None:
         print("No solutions found")
         return
 
-    root = Path(__file__).parent.parent
-
     if year is None:
-        test_dir = "tests/"
+        test_dir = _ROOT / "tests"
     else:
-        test_dir = f"{year}/tests/"
+        test_dir = _ROOT / str(year) / "tests"
 
-    import subprocess
+    if days is None:
+        test_paths = [test_dir]
+    else:
+        test_paths = []
+        for day in days:
+            if day not in available_days:
+                print(
+                    f"✗ Error: Solution for day {day} not found: "
+                    f"{_day_module_path(day, year)}",
+                    file=sys.stderr,
+                )
+                continue
 
-    result = subprocess.run(
-        [
-            "uv",
-            "run",
-            "pytest",
-            test_dir,
-            "-v",
-            "-m",
-            "benchmark",
-            "--benchmark-only",
-        ],
-        cwd=root,
-    )
+            test_path = test_dir / f"test_day{day:02d}.py"
+            if not test_path.exists():
+                print(
+                    f"✗ Error: Test file for day {day} not found: {test_path}",
+                    file=sys.stderr,
+                )
+                continue
+
+            test_paths.append(test_path)
+
+        if not test_paths:
+            print("No solutions found")
+            return
 
-    sys.exit(result.returncode)
+    sys.exit(_run_benchmarks(test_paths))
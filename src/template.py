@@ -1,38 +1,48 @@
 """Template management for scaffolding new day solutions."""
 
+import functools
 import json
+import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
-from src.aoc_cli import download_input, download_puzzle
+from src.aoc_cli import download_both
 
+_THIS_DIR = Path(__file__).resolve().parent
+_ROOT = _THIS_DIR.parent
 
-def load_config() -> dict:
-    """Load configuration from .aoc-cli.json."""
-    config_path = Path(__file__).parent.parent / ".aoc-cli.json"
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Mapping:
+    """Load configuration from .aoc-cli.json.
+
+    The parsed config is cached and returned as a read-only mapping.
+    """
+    config_path = _ROOT / ".aoc-cli.json"
     with open(config_path) as f:
-        return json.load(f)
+        return MappingProxyType(json.load(f))
 
 
+@functools.lru_cache(maxsize=1)
 def read_template() -> str:
-    """Read the solution template file."""
-    template_path = Path(__file__).parent / "solutions" / "template.txt"
+    """Read the solution template file (cached per process)."""
+    template_path = _THIS_DIR / "solutions" / "template.txt"
     return template_path.read_text()
 
 
 def get_solutions_dir(year: int | None = None) -> Path:
     """Get solutions directory, optionally for a specific year."""
-    root = Path(__file__).parent.parent
     if year is None:
-        return root / "src" / "solutions"
-    return root / str(year) / "solutions"
+        return _ROOT / "src" / "solutions"
+    return _ROOT / str(year) / "solutions"
 
 
 def get_tests_dir(year: int | None = None) -> Path:
     """Get tests directory, optionally for a specific year."""
-    root = Path(__file__).parent.parent
     if year is None:
-        return root / "tests"
-    return root / str(year) / "tests"
+        return _ROOT / "tests"
+    return _ROOT / str(year) / "tests"
 
 
 def scaffold_day(day: int, download: bool = False) -> tuple[Path, Path, Path]:
@@ -49,10 +59,9 @@ def scaffold_day(day: int, download: bool = False) -> tuple[Path, Path, Path]:
     config = load_config()
     year = config.get("year", 2025)
     day_padded = f"{day:02d}"
-    root = Path(__file__).parent.parent
 
     # Year-based paths
-    year_dir = root / str(year)
+    year_dir = _ROOT / str(year)
     solutions_dir = year_dir / "solutions"
     tests_dir = year_dir / "tests"
     data_dir = year_dir / "data"
@@ -61,8 +70,6 @@ def scaffold_day(day: int, download: bool = False) -> tuple[Path, Path, Path]:
     solution_path = solutions_dir / f"day{day_padded}.py"
     test_path = tests_dir / f"test_day{day_padded}.py"
     example_path = data_dir / "examples" / f"{day_padded}.txt"
-    input_path = data_dir / "inputs" / f"{day_padded}.txt"
-    puzzle_path = data_dir / "puzzles" / f"{day_padded}.md"
 
     # Check if already exists
     if solution_path.exists():
@@ -71,8 +78,7 @@ def scaffold_day(day: int, download: bool = False) -> tuple[Path, Path, Path]:
     # Download input and puzzle if requested
     if download:
         try:
-            download_input(day, year)
-            download_puzzle(day, year)
+            download_both(day, year)
         except Exception as e:
             print(f"Warning: Could not download data: {e}")
             # Continue scaffolding even if download fails
@@ -105,6 +111,8 @@ from src.aoc_cli import read_example
 year_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(year_dir))
 
+_DAY_RE = re.compile(r"day(\\d+)")
+
 
 @pytest.fixture
 def example(request):
@@ -115,7 +123,7 @@ def example(request):
     and loads the corresponding example file from the year-specific data dir.
     """
     test_file = Path(request.fspath).name  # e.g., "test_day01.py"
-    match = re.search(r"day(\\d+)", test_file)
+    match = _DAY_RE.search(test_file)
     if not match:
         raise ValueError(f"Could not extract day number from {test_file}")
 
@@ -197,36 +205,60 @@ def test_benchmark_day{day_padded}_part_two(benchmark):
     if not example_path.exists():
         example_path.touch()
 
-    # Create empty input/puzzle files if they don't exist and weren't downloaded
-    if not input_path.exists():
-        input_path.touch()
-    if not puzzle_path.exists():
-        puzzle_path.touch()
-
     return solution_path, test_path, example_path
 
 
-def get_available_days(year: int | None = None) -> list[int]:
-    """Get list of days that have been scaffolded.
+def _scan_day_entries(year: int | None = None) -> list[tuple[int, os.DirEntry]]:
+    """Scan the solutions directory for dayNN.py files.
 
     Args:
-        year: Optional year to filter. If not provided, checks root src/solutions.
+        year: Optional year to filter. If not provided, checks root
+              src/solutions.
 
     Returns:
-        Sorted list of available day numbers.
+        List of (day, entry) tuples sorted by day.
     """
     if year is None:
-        solutions_dir = Path(__file__).parent / "solutions"
+        solutions_dir = _THIS_DIR / "solutions"
     else:
-        solutions_dir = Path(__file__).parent.parent / str(year) / "solutions"
+        solutions_dir = _ROOT / str(year) / "solutions"
 
-    days = []
+    try:
+        with os.scandir(solutions_dir) as entries:
+            return sorted(
+                (
+                    (int(entry.name[3:-3]), entry)
+                    for entry in entries
+                    if entry.name.startswith("day")
+                    and entry.name.endswith(".py")
+                    and entry.name[3:-3].isdecimal()
+                ),
+                key=lambda item: item[0],
+            )
+    except FileNotFoundError:
+        return []
 
-    for file in solutions_dir.glob("day*.py"):
-        try:
-            day_num = int(file.stem.replace("day", ""))
-            days.append(day_num)
-        except ValueError:
-            continue
 
-    return sorted(days)
+def iter_day_modules(year: int | None = None) -> list[tuple[int, Path]]:
+    """Get scaffolded days together with their solution module paths.
+
+    Args:
+        year: Optional year to filter. If not provided, checks root
+              src/solutions.
+
+    Returns:
+        List of (day, module_path) tuples sorted by day.
+    """
+    return [(day, Path(entry.path)) for day, entry in _scan_day_entries(year)]
+
+
+def get_available_days(year: int | None = None) -> list[int]:
+    """Get list of days that have been scaffolded.
+
+    Args:
+        year: Optional year to filter. If not provided, checks root src/solutions.
+
+    Returns:
+        Sorted list of available day numbers.
+    """
+    return [day for day, _ in _scan_day_entries(year)]